@@ -9,8 +9,10 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN, KOERI_URL
 from .api import HasWaveDepremAPI
+from .cache import EventCache, get_event_cache
+from .export import EventExporter, build_exporter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         limit=int(entry.data.get("limit", 50)),
         city=city,
         region=region,
+        url=entry.data.get("url") or KOERI_URL,
     )
 
     update_interval_sec = int(
@@ -37,6 +40,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.options.get("notify_above_magnitude", entry.data.get("notify_above_magnitude", 4.0))
     )
 
+    exporter = build_exporter(
+        hass,
+        mqtt_topic=(entry.options.get("mqtt_topic", entry.data.get("mqtt_topic")) or "").strip(),
+        webhook_url=(entry.options.get("webhook_url", entry.data.get("webhook_url")) or "").strip(),
+        export_file=(entry.options.get("export_file", entry.data.get("export_file")) or "").strip(),
+    )
+
+    event_cache = get_event_cache(hass)
+    coordinator = _create_coordinator(
+        hass, api, update_interval_sec, notify_above, exporter, event_cache, entry.entry_id
+    )
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": coordinator,
+        "api": api,
+        "exporter": exporter,
+        "notify_above_magnitude": notify_above,
+    }
+
+    # Options değişince yeniden yükle
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Sink görevleri entry'ye bağlı ve platformlar kurulduktan sonra başlar
+    exporter.start(entry)
+
+    # İlk veri arka planda çekilir; KOERI yavaşsa açılışı bekletmez.
+    # O zamana kadar entity'ler son bilinen (restore) durumu gösterir.
+    # Entry'ye bağlı görev: reload/kaldırma sırasında iptal edilir.
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        f"{DOMAIN}_first_refresh_{entry.entry_id}",
+    )
+    return True
+
+
+def _create_coordinator(
+    hass: HomeAssistant,
+    api: HasWaveDepremAPI,
+    update_interval_sec: int,
+    notify_above: float,
+    exporter: EventExporter,
+    event_cache: EventCache,
+    entry_id: str,
+) -> DataUpdateCoordinator:
+    """KOERI verisini çeken ve yeni depremde bildirim atan coordinator."""
     # Sadece yeni depremde bildirim: son gördüğümüz en güncel depremin timestamp'i
     last_seen_latest_ts: int = 0
 
@@ -45,7 +94,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             data = await hass.async_add_executor_job(api.fetch_earthquakes)
             if data is None:
-                return []
+                # Hata: önceki veri (ilk başarıdan önce None -> restore durumu) korunur
+                return coordinator.data
+            # Fetch sürerken entry kaldırıldı/yeniden yüklendiyse sonucu kullanma
+            if hass.data.get(DOMAIN, {}).get(entry_id, {}).get("coordinator") is not coordinator:
+                return coordinator.data
+            # Entry'ler aynı depremin kopyalarını değil paylaşılan nesneleri tutar
+            data = event_cache.set_view(entry_id, data)
+            # Yeni depremler sink kuyruklarına bırakılır; yayın arka planda yapılır
+            exporter.process(data)
             # Yeni deprem: listedeki ilk (en güncel) deprem daha önce gördüğümüzden yeni mi?
             if data and len(data) > 0:
                 latest = data[0]
@@ -67,7 +124,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return data
         except Exception as err:
             _LOGGER.error("Deprem veri güncelleme hatası: %s", err, exc_info=True)
-            return []
+            return coordinator.data
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -76,22 +133,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_method=async_update_data,
         update_interval=timedelta(seconds=update_interval_sec),
     )
-
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.error("İlk deprem verisi yükleme hatası: %s", err)
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        "coordinator": coordinator,
-        "api": api,
-        "notify_above_magnitude": notify_above,
-    }
-
-    # Options değişince yeniden yükle
-    entry.async_on_unload(entry.add_update_listener(_async_update_options))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
+    return coordinator
 
 
 async def _send_quake_notification(
@@ -123,5 +165,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Kaldırma."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data:
+            await entry_data["exporter"].async_stop()
+        get_event_cache(hass).release(entry.entry_id)
     return unload_ok
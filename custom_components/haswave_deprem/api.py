@@ -6,9 +6,8 @@ import re
 from datetime import datetime
 from typing import Any
 
-import requests
-
 from .const import CITIES, KOERI_URL, REGIONS
+from .geo import PROVINCE_REGIONS, lookup_province
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,9 +21,66 @@ def _normalize(s: str) -> str:
     return re.sub(r"\s+", "", s.upper())
 
 
-def _matches_city(location: str, city: str) -> bool:
-    """İl filtresi (PHP matchesCity)."""
-    if not city or not location:
+_ASCII_FOLD = str.maketrans("İIŞĞÜÖÇ", "IISGUOC")
+
+
+def _fold(s: str) -> str:
+    """Normalize + Türkçe karakterleri ASCII'ye indir (KOERI "IZMIR" yazar)."""
+    return _normalize(s).translate(_ASCII_FOLD)
+
+
+_FOLDED_CITIES = {_fold(il): il for il in CITIES}
+
+# KOERI lokasyonundaki parantezli ek: "KOZAN (ADANA)"
+_PAREN_RE = re.compile(r"\(([^()]+)\)")
+
+
+def _province_from_text(location: str) -> str | None:
+    """Lokasyondaki "(IL)" eki bir il adıysa o il (Türkçe/ASCII yazım farkı önemsiz)."""
+    for name in reversed(_PAREN_RE.findall(location or "")):
+        province = _FOLDED_CITIES.get(_fold(name))
+        if province:
+            return province
+    return None
+
+
+def _resolve_province(location: str, latitude: float | None, longitude: float | None) -> str | None:
+    """İl: önce KOERI'nin "(IL)" eki, yoksa (deniz/isimsiz) koordinattan il sınırları."""
+    return _province_from_text(location) or lookup_province(latitude, longitude)
+
+
+def _location_from_parts(tail: list[str]) -> str:
+    """Lokasyon: çözüm niteliği sütunu ("İlksel" / "REVIZE01 (tarih saat)") hariç.
+
+    PHP array_slice($parts, 8, -1) revize satırlarında "REVIZE01 (yyyy.mm.dd"
+    parçasını lokasyona katıyordu; o zaman aynı deprem revizyonda farklı görünür.
+    """
+    for i, token in enumerate(tail):
+        folded = _fold(token)
+        if folded == "ILKSEL" or folded.startswith("REVIZE"):
+            return " ".join(tail[:i]).strip()
+    return " ".join(tail[:-1]).strip()
+
+
+def _parse_coord(value: str) -> float | None:
+    try:
+        return float(value.replace(",", "."))
+    except ValueError:
+        return None
+
+
+def _matches_city(location: str, city: str, province: str | None = None) -> bool:
+    """İl filtresi: depremin ili bulunduysa onu, yoksa metni (PHP matchesCity) kullanır."""
+    if not city:
+        return True
+    if province:
+        city_f = _fold(city)
+        province_f = _fold(province)
+        # Tam il adıysa birebir (MUŞ/GÜMÜŞHANE), değilse kısaltma (AFYON, MARAŞ)
+        if city_f in _FOLDED_CITIES:
+            return city_f == province_f
+        return city_f in province_f
+    if not location:
         return True
     city_upper = city.strip().upper()
     city_n = _normalize(city_upper)
@@ -38,9 +94,15 @@ def _matches_city(location: str, city: str) -> bool:
     return False
 
 
-def _matches_region(location: str, region: str) -> bool:
-    """Bölge filtresi (PHP matchesRegion)."""
-    if not region or not location:
+def _matches_region(location: str, region: str, province: str | None = None) -> bool:
+    """Bölge filtresi: depremin ili bulunduysa ilin bölgeleri, yoksa metin (PHP matchesRegion)."""
+    if not region:
+        return True
+    if province:
+        # DÜZCE gibi iller birden fazla bölgede
+        region_f = _fold(region)
+        return any(_fold(r) == region_f for r in PROVINCE_REGIONS.get(province, ()))
+    if not location:
         return True
     region_upper = region.strip().upper()
     loc_n = _normalize(location)
@@ -53,11 +115,25 @@ def _matches_region(location: str, region: str) -> bool:
     return False
 
 
+def _parse_magnitude(values: list[str]) -> float | None:
+    """Boş olmayan ("-.-" değil) ilk büyüklük."""
+    for value in values:
+        try:
+            return float(value.replace(",", "."))
+        except ValueError:
+            continue
+    return None
+
+
 def _parse_koeri_content(raw: bytes, limit: int) -> list[dict[str, Any]]:
     """
     KOERI lst0.asp çıktısını parse eder (PHP fetchEarthquakes ile aynı).
-    Satır formatı: YYYY.MM.DD HH:MM:SS ... magnitude depth location
-    parts[0]=date, [1]=time, [6]=magnitude, [7]=depth, [8:-1]=location
+    Satır formatı: Tarih Saat Enlem(N) Boylam(E) Derinlik(km) MD ML Mw Yer Çözüm Niteliği
+    parts[0]=date, [1]=time, [2]=lat, [3]=lon, [4]=depth, [5]=MD, [6]=ML, [7]=Mw,
+    [8:]=location + çözüm niteliği (_location_from_parts ayırır).
+    Büyüklük ML; boşsa ("-.-") Mw, o da boşsa MD. PHP derinliği [7]'den (Mw) okuyordu;
+    Mw çoğu satırda "-.-" olduğundan bu satırlar atlanıyordu.
+    İl önce "(IL)" ekinden, yoksa koordinattan (geo.lookup_province) bulunur; Türkiye dışıysa None.
     """
     try:
         text = raw.decode("iso-8859-9", errors="replace")
@@ -73,23 +149,29 @@ def _parse_koeri_content(raw: bytes, limit: int) -> list[dict[str, Any]]:
             continue
         try:
             date_str = f"{parts[0]} {parts[1]}"
-            magnitude = float(parts[6].replace(",", "."))
-            depth = float(parts[7].replace(",", "."))
-            # PHP: array_slice($parts, 8, -1)
-            location = " ".join(parts[8:-1]).strip() if len(parts) > 8 else ""
-            if magnitude <= 0 or magnitude > 10:
+            magnitude = _parse_magnitude([parts[6], parts[7], parts[5]])
+            depth = float(parts[4].replace(",", "."))
+            location = _location_from_parts(parts[8:])
+            if magnitude is None or magnitude <= 0 or magnitude > 10:
                 continue
             try:
                 dt = datetime.strptime(date_str, "%Y.%m.%d %H:%M:%S")
                 timestamp = int(dt.timestamp())
             except ValueError:
                 timestamp = 0
+            latitude = _parse_coord(parts[2])
+            longitude = _parse_coord(parts[3])
+            province = _resolve_province(location, latitude, longitude)
             earthquakes.append({
                 "date": date_str,
                 "timestamp": timestamp,
                 "magnitude": magnitude,
                 "depth": depth,
                 "location": location,
+                "latitude": latitude,
+                "longitude": longitude,
+                "province": province,
+                "region": (PROVINCE_REGIONS.get(province) or (None,))[0] if province else None,
             })
         except (ValueError, IndexError):
             continue
@@ -107,17 +189,37 @@ class HasWaveDepremAPI:
         limit: int = 50,
         city: str = "",
         region: str = "",
+        url: str = KOERI_URL,
     ) -> None:
+        self.url = url
         self.min_magnitude = min_magnitude
         self.limit = limit
         self.city = (city or "").strip()
         self.region = (region or "").strip()
 
+    def filter_earthquakes(self, earthquakes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Büyüklük, il ve bölge filtresini uygula; en fazla limit kadar döndür."""
+        filtered: list[dict[str, Any]] = []
+        for eq in earthquakes:
+            if eq["magnitude"] < self.min_magnitude:
+                continue
+            if self.city and not _matches_city(eq["location"], self.city, eq["province"]):
+                continue
+            if self.region and not _matches_region(eq["location"], self.region, eq["province"]):
+                continue
+            filtered.append(eq)
+            if len(filtered) >= self.limit:
+                break
+        return filtered
+
     def fetch_earthquakes(self) -> list[dict[str, Any]] | None:
         """KOERI lst0.asp'den veri çeker, filtreler ve döndürür."""
+        # requests ağır bir import; executor'da ilk çağrıda yüklenir (HA açılışını yavaşlatmasın)
+        import requests
+
         try:
             response = requests.get(
-                KOERI_URL,
+                self.url,
                 timeout=15,
                 headers={"User-Agent": USER_AGENT},
             )
@@ -127,18 +229,7 @@ class HasWaveDepremAPI:
                 _LOGGER.warning("KOERI boş yanıt")
                 return []
             # PHP limit'i sonradan uyguluyor; önce yeterince parse edelim
-            all_quakes = _parse_koeri_content(raw, limit=500)
-            filtered: list[dict[str, Any]] = []
-            for eq in all_quakes:
-                if eq["magnitude"] < self.min_magnitude:
-                    continue
-                if self.city and not _matches_city(eq["location"], self.city):
-                    continue
-                if self.region and not _matches_region(eq["location"], self.region):
-                    continue
-                filtered.append(eq)
-                if len(filtered) >= self.limit:
-                    break
+            filtered = self.filter_earthquakes(_parse_koeri_content(raw, limit=500))
             if filtered:
                 _LOGGER.info("KOERI: %s deprem alındı", len(filtered))
             else:
@@ -5,12 +5,14 @@ import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DOMAIN, LATEST_ATTRIBUTES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +34,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class DepremUyariBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class DepremUyariBinarySensor(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
     """Son deprem belirtilen büyüklük eşiğinin üzerindeyse ON."""
 
     def __init__(
@@ -49,10 +51,26 @@ class DepremUyariBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_name = "Deprem uyarısı"
         self._attr_icon = "mdi:earthquake"
         self._attr_device_info = device_info
+        self._restored_is_on: bool | None = None
+        self._restored_attrs: dict = {}
+
+    async def async_added_to_hass(self) -> None:
+        """İlk KOERI verisi gelene kadar son bilinen durumu geri yükle."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            return
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state in (STATE_ON, STATE_OFF):
+            self._restored_is_on = last_state.state == STATE_ON
+            self._restored_attrs = {
+                k: v for k, v in last_state.attributes.items() if k in LATEST_ATTRIBUTES
+            }
 
     @property
     def is_on(self) -> bool:
         """Son deprem eşik üzerindeyse True."""
+        if self.coordinator.data is None and self._restored_is_on is not None:
+            return self._restored_is_on
         earthquakes = self.coordinator.data or []
         if not earthquakes:
             return False
@@ -68,14 +86,10 @@ class DepremUyariBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Son deprem bilgisi."""
+        if self.coordinator.data is None:
+            return dict(self._restored_attrs)
         earthquakes = self.coordinator.data or []
         if not earthquakes:
             return {}
         latest = earthquakes[0]
-        return {
-            "magnitude": latest.get("magnitude"),
-            "location": latest.get("location"),
-            "depth": latest.get("depth"),
-            "date": latest.get("date"),
-            "timestamp": latest.get("timestamp"),
-        }
+        return {key: latest.get(key) for key in LATEST_ATTRIBUTES}
@@ -0,0 +1,110 @@
+"""Tüm config entry'lerin paylaştığı, bellek sınırlı deprem önbelleği.
+
+Her entry KOERI listesini ayrı parse eder; aynı deprem için ayrı dict'ler
+oluşur. Önbellek her depremi tek bir nesneye indirger (intern): entry'lerin
+listeleri bu ortak nesnelere referans tutan görünümlerdir, kopya değil.
+Hiçbir entry'nin görmediği olaylar yaşa veya boyuta göre atılır; böylece
+entry sayısı arttıkça bellek sabit kalır.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_EVENT_CACHE, DEFAULT_CACHE_MAX_AGE, DEFAULT_CACHE_MAX_SIZE
+
+EventKey = tuple[str, str]
+
+
+def event_key(eq: dict[str, Any]) -> EventKey:
+    """Bir depremi listeler ve KOERI revizyonları arasında tanımlayan anahtar.
+
+    Lokasyon çözüm niteliği sütunu olmadan parse edilir (api._location_from_parts),
+    böylece "REVIZE01" satırı aynı anahtara düşer.
+    """
+    return (eq.get("date") or "", eq.get("location") or "")
+
+
+class EventCache:
+    """Referans sayımlı, paylaşılan deprem nesneleri."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        max_age: float = DEFAULT_CACHE_MAX_AGE,
+    ) -> None:
+        self.max_size = max_size
+        self.max_age = max_age
+        # Anahtar -> (ortak nesne); en eski erişilen başta
+        self._events: OrderedDict[EventKey, dict[str, Any]] = OrderedDict()
+        self._refs: dict[EventKey, int] = {}
+        self._last_seen: dict[EventKey, float] = {}
+        self._views: dict[str, list[EventKey]] = {}
+        self.evicted = 0
+
+    def _intern(self, eq: dict[str, Any], now: float) -> dict[str, Any]:
+        key = event_key(eq)
+        cached = self._events.get(key)
+        if cached is None:
+            self._refs[key] = 0
+        else:
+            self._events.move_to_end(key)
+            if cached == eq:
+                self._last_seen[key] = now
+                return cached
+        # Yeni olay veya KOERI revizyonu: yeni nesne konur, eskisi değiştirilmez
+        # (başka entry'lerin verisi ve HA state'leri onu tutuyor olabilir)
+        self._events[key] = eq
+        self._last_seen[key] = now
+        return eq
+
+    def set_view(self, entry_id: str, earthquakes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Entry'nin listesini ortak nesnelerden oluşan görünümle değiştir."""
+        now = time.monotonic()
+        view = [self._intern(eq, now) for eq in earthquakes]
+        keys = [event_key(eq) for eq in view]
+        for key in keys:
+            self._refs[key] += 1
+        for key in self._views.get(entry_id, ()):
+            self._refs[key] -= 1
+        self._views[entry_id] = keys
+        self._evict(now)
+        return view
+
+    def release(self, entry_id: str) -> None:
+        """Entry kaldırılınca referanslarını bırak."""
+        for key in self._views.pop(entry_id, ()):
+            self._refs[key] -= 1
+        self._evict(time.monotonic())
+
+    def _evict(self, now: float) -> None:
+        """Referanssız olayları yaş veya boyut sınırına göre at (LRU sırası)."""
+        over = len(self._events) - self.max_size
+        for key in list(self._events):
+            if self._refs[key] > 0:
+                continue
+            if over > 0 or now - self._last_seen[key] > self.max_age:
+                del self._events[key], self._refs[key], self._last_seen[key]
+                self.evicted += 1
+                over -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Tanılama (diagnostics) için önbellek durumu."""
+        referenced = sum(1 for count in self._refs.values() if count > 0)
+        return {
+            "size": len(self._events),
+            "referenced": referenced,
+            "unreferenced": len(self._events) - referenced,
+            "views": {entry_id: len(keys) for entry_id, keys in self._views.items()},
+            "evicted": self.evicted,
+            "max_size": self.max_size,
+            "max_age": self.max_age,
+        }
+
+
+def get_event_cache(hass: HomeAssistant) -> EventCache:
+    """Domain genelindeki tek önbelleği döndür (yoksa oluştur)."""
+    return hass.data.setdefault(DATA_EVENT_CACHE, EventCache())
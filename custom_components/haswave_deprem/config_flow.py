@@ -12,6 +12,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DEFAULT_LIMIT,
@@ -21,9 +22,13 @@ from .const import (
     DOMAIN,
 )
 from .api import HasWaveDepremAPI
+from .export import export_file_path
 
 _LOGGER = logging.getLogger(__name__)
 
+# strings.json bir kez okunur; her form gösteriminde diske gidilmez
+_STRINGS: dict | None = None
+
 
 def _load_strings() -> dict:
     """Load strings.json (sync, call from executor in async steps)."""
@@ -36,6 +41,14 @@ def _load_strings() -> dict:
         return {}
 
 
+async def _async_get_strings(hass: HomeAssistant) -> dict:
+    """strings.json'u ilk çağrıda executor'da yükle, sonra önbellekten döndür."""
+    global _STRINGS
+    if _STRINGS is None:
+        _STRINGS = await hass.async_add_executor_job(_load_strings)
+    return _STRINGS
+
+
 def _get_schema(strings: dict) -> vol.Schema:
     return vol.Schema(
         {
@@ -76,7 +89,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Tek adım: tüm ayarlar."""
-        strings = await self.hass.async_add_executor_job(_load_strings)
+        strings = await _async_get_strings(self.hass)
         error_strings = strings.get("config", {}).get("error", {})
 
         if user_input is None:
@@ -114,8 +127,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self._config_entry = config_entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            export_file = (user_input.get("export_file") or "").strip()
+            if export_file and export_file_path(self.hass, export_file) is None:
+                strings = await _async_get_strings(self.hass)
+                error_strings = strings.get("config", {}).get("options", {}).get("error", {})
+                errors["export_file"] = error_strings.get("invalid_export_file", "invalid_export_file")
+            else:
+                return self.async_create_entry(title="", data=user_input)
         d = self._config_entry.data or {}
         opt = self._config_entry.options or {}
         interval = opt.get("update_interval", d.get("update_interval", DEFAULT_UPDATE_INTERVAL))
@@ -128,6 +148,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             notify = float(notify)
         except (TypeError, ValueError):
             notify = DEFAULT_NOTIFY_ABOVE_MAGNITUDE
+        mqtt_topic = opt.get("mqtt_topic", d.get("mqtt_topic")) or ""
+        webhook_url = opt.get("webhook_url", d.get("webhook_url")) or ""
+        export_file = opt.get("export_file", d.get("export_file")) or ""
+        if user_input is not None:
+            # Hatalı gönderimde girilen değerler formda kalsın
+            mqtt_topic = user_input.get("mqtt_topic", mqtt_topic)
+            webhook_url = user_input.get("webhook_url", webhook_url)
+            export_file = user_input.get("export_file", export_file)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
@@ -147,7 +175,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     "notify_above_magnitude",
                     default=notify,
                 ): vol.Coerce(float),
+                vol.Optional("mqtt_topic", default=mqtt_topic): str,
+                # Boş = kapalı; doluysa geçerli bir URL olmalı
+                vol.Optional("webhook_url", default=webhook_url): vol.Any("", cv.url),
+                vol.Optional("export_file", default=export_file): str,
             }),
+            errors=errors,
         )
 
 
@@ -10,6 +10,22 @@ DEFAULT_UPDATE_INTERVAL = 300  # 5 dakika (saniye)
 DEFAULT_MIN_MAGNITUDE = 0.0
 DEFAULT_LIMIT = 50
 DEFAULT_NOTIFY_ABOVE_MAGNITUDE = 4.0  # Bu büyüklük ve üzeri yeni depremde bildirim
+DEFAULT_EXPORT_QUEUE_SIZE = 1000  # Sink başına bekleyen en fazla olay
+DEFAULT_EXPORT_BATCH_SIZE = 50  # Tek yayında gönderilen en fazla olay
+DEFAULT_EXPORT_RETRIES = 3  # Başarısız batch için en fazla deneme
+DEFAULT_EXPORT_DRAIN_TIMEOUT = 10  # Kapanışta kuyruğu boşaltmak için beklenen süre (saniye)
+DEFAULT_EXPORT_SEEN_SIZE = 2000  # Tekrar aktarmamak için hatırlanan en fazla olay anahtarı
+DEFAULT_CACHE_MAX_SIZE = 1000  # Paylaşılan önbellekte tutulan en fazla olay
+DEFAULT_CACHE_MAX_AGE = 3600  # Hiçbir entry'nin görmediği olay bu kadar sonra atılır (saniye)
+
+# Son deprem attribute'ları (sensor/binary_sensor); ilk veri gelene kadar geri yüklenir
+LATEST_ATTRIBUTES = (
+    "magnitude", "location", "depth", "date", "timestamp",
+    "latitude", "longitude", "province", "region",
+)
+
+# hass.data anahtarları
+DATA_EVENT_CACHE = f"{DOMAIN}_event_cache"
 
 # Config keys
 CONF_UPDATE_INTERVAL = "update_interval"
@@ -19,6 +35,10 @@ CONF_NOTIFY_ABOVE_MAGNITUDE = "notify_above_magnitude"
 CONF_ALL_EARTHQUAKES = "all_earthquakes"
 CONF_CITY = "city"
 CONF_REGION = "region"
+CONF_URL = "url"  # Sadece test/yük aracı için (scripts/replay.py); arayüzde yok
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_WEBHOOK_URL = "webhook_url"
+CONF_EXPORT_FILE = "export_file"
 
 # Türkiye illeri (PHP ile uyumlu)
 CITIES = [
@@ -39,7 +59,7 @@ REGIONS: dict[str, list[str]] = {
     "MARMARA": ["İSTANBUL", "BURSA", "KOCAELİ", "BALIKESİR", "SAKARYA", "TEKİRDAĞ", "ÇANAKKALE", "EDİRNE", "KIRKLARELİ", "YALOVA", "BİLECİK", "DÜZCE"],
     "EGE": ["İZMİR", "AYDIN", "MUĞLA", "MANİSA", "AFYONKARAHİSAR", "DENİZLİ", "KÜTAHYA", "UŞAK"],
     "AKDENİZ": ["ANTALYA", "ADANA", "MERSİN", "HATAY", "KAHRAMANMARAŞ", "OSMANİYE", "ISPARTA", "BURDUR"],
-    "İÇ ANADOLU": ["ANKARA", "KONYA", "ESKİŞEHİR", "KAYSERİ", "SİVAS", "YOZGAT", "AKSARAY", "KIRIKKALE", "KIRŞEHİR", "NEVŞEHİR", "NİĞDE", "KARAMAN"],
+    "İÇ ANADOLU": ["ANKARA", "KONYA", "ESKİŞEHİR", "KAYSERİ", "SİVAS", "YOZGAT", "AKSARAY", "KIRIKKALE", "KIRŞEHİR", "NEVŞEHİR", "NİĞDE", "KARAMAN", "ÇANKIRI"],
     "KARADENİZ": ["SAMSUN", "TRABZON", "ORDU", "GİRESUN", "RİZE", "ZONGULDAK", "KARABÜK", "KASTAMONU", "SİNOP", "AMASYA", "TOKAT", "ÇORUM", "ARTVİN", "BARTIN", "BOLU", "DÜZCE"],
     "DOĞU ANADOLU": ["ERZURUM", "ERZİNCAN", "VAN", "MALATYA", "ELAZIĞ", "BİNGÖL", "MUŞ", "BİTLİS", "AĞRI", "KARS", "ARDAHAN", "IĞDIR", "TUNCELİ", "BAYBURT", "GÜMÜŞHANE"],
     "GÜNEYDOĞU ANADOLU": ["GAZİANTEP", "ŞANLIURFA", "DİYARBAKIR", "MARDİN", "BATMAN", "SİİRT", "ŞIRNAK", "HAKKARİ", "KİLİS", "ADIYAMAN"],
@@ -0,0 +1,30 @@
+"""Diagnostics for HasWave Deprem: paylaşılan önbellek ve entry durumu."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .cache import get_event_cache
+from .const import CONF_WEBHOOK_URL, DOMAIN
+
+TO_REDACT = {CONF_WEBHOOK_URL}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Tanılama indirmesi: önbellek boyutu ve bu entry'nin görünümü."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    coordinator = entry_data.get("coordinator")
+    exporter = entry_data.get("exporter")
+    return {
+        "data": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": async_redact_data(dict(entry.options), TO_REDACT),
+        "event_count": len(coordinator.data or []) if coordinator is not None else 0,
+        "last_update_success": coordinator.last_update_success if coordinator is not None else None,
+        "event_cache": get_event_cache(hass).stats(),
+        "export": {
+            sink.name: {"dropped": sink.dropped, "failed": sink.failed} for sink in exporter.sinks
+        } if exporter is not None else {},
+    }
@@ -0,0 +1,228 @@
+"""Yeni depremleri MQTT / webhook / NDJSON dosyasına aktaran sink'ler.
+
+Coordinator yenilemesi sadece kuyruğa bırakır (bloklamaz); her sink kendi
+arka plan görevinde kuyruğu toplu (batch) halde boşaltır. Kuyruk doluysa en
+eski olaylar düşürülür, böylece yavaş bir sink yenilemeyi asla bekletmez.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .cache import EventKey, event_key
+from .const import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    DEFAULT_EXPORT_DRAIN_TIMEOUT,
+    DEFAULT_EXPORT_QUEUE_SIZE,
+    DEFAULT_EXPORT_RETRIES,
+    DEFAULT_EXPORT_SEEN_SIZE,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventSink:
+    """Sınırlı kuyruklu, toplu yayın yapan sink temeli."""
+
+    name = "sink"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        queue_size: int = DEFAULT_EXPORT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> None:
+        self.hass = hass
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.failed = 0
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task | None = None
+
+    def start(self, entry: ConfigEntry) -> None:
+        """Kuyruğu boşaltan, entry'ye bağlı arka plan görevini başlat.
+
+        Kurulum yarıda kalırsa veya entry kaldırılırsa HA görevi iptal eder.
+        """
+        self._task = entry.async_create_background_task(
+            self.hass, self._async_run(), f"{DOMAIN}_{self.name}_export_{entry.entry_id}"
+        )
+
+    async def async_stop(self, timeout: float = DEFAULT_EXPORT_DRAIN_TIMEOUT) -> None:
+        """Kuyruktaki olayları (en fazla timeout saniye) gönderip görevi durdur."""
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "%s sink kapanışta boşaltılamadı, %s olay kaldı", self.name, self._queue.qsize()
+                )
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def enqueue(self, events: list[dict[str, Any]]) -> None:
+        """Olayları kuyruğa bırak; doluysa en eskisini düşür (backpressure)."""
+        dropped = 0
+        for eq in events:
+            if self._queue.full():
+                self._queue.get_nowait()
+                self._queue.task_done()
+                dropped += 1
+            self._queue.put_nowait(eq)
+        if dropped:
+            self.dropped += dropped
+            _LOGGER.warning(
+                "%s sink yetişemiyor, en eski %s olay düşürüldü (toplam %s)", self.name, dropped, self.dropped
+            )
+
+    async def _async_run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for attempt in range(1, DEFAULT_EXPORT_RETRIES + 1):
+                try:
+                    await self.async_publish(batch)
+                    break
+                except Exception as e:
+                    if attempt == DEFAULT_EXPORT_RETRIES:
+                        self.failed += len(batch)
+                        _LOGGER.error(
+                            "%s sink yayın hatası (%s olay, %s deneme): %s", self.name, len(batch), attempt, e
+                        )
+                    else:
+                        await asyncio.sleep(attempt)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def async_publish(self, batch: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+
+class MqttSink(EventSink):
+    """Her olayı HA MQTT entegrasyonu üzerinden ayrı mesaj olarak yayınla."""
+
+    name = "mqtt"
+
+    def __init__(self, hass: HomeAssistant, topic: str, **kwargs: Any) -> None:
+        super().__init__(hass, **kwargs)
+        self.topic = topic
+
+    async def async_publish(self, batch: list[dict[str, Any]]) -> None:
+        from homeassistant.components import mqtt
+
+        for eq in batch:
+            await mqtt.async_publish(self.hass, self.topic, json.dumps(eq, ensure_ascii=False))
+
+
+class WebhookSink(EventSink):
+    """Batch'i tek bir JSON dizisi olarak webhook'a POST et."""
+
+    name = "webhook"
+
+    def __init__(self, hass: HomeAssistant, url: str, **kwargs: Any) -> None:
+        super().__init__(hass, **kwargs)
+        self.url = url
+
+    async def async_publish(self, batch: list[dict[str, Any]]) -> None:
+        session = async_get_clientsession(self.hass)
+        async with session.post(self.url, json=batch, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+
+
+def export_file_path(hass: HomeAssistant, path: str) -> Path | None:
+    """Config klasörüne göre yol; allowlist_external_dirs dışındaysa None."""
+    resolved = Path(hass.config.path(path))
+    if not hass.config.is_allowed_path(str(resolved)):
+        return None
+    return resolved
+
+
+class FileSink(EventSink):
+    """Batch'i append-only NDJSON dosyasına yaz (executor'da)."""
+
+    name = "file"
+
+    def __init__(self, hass: HomeAssistant, path: str, **kwargs: Any) -> None:
+        resolved = export_file_path(hass, path)
+        if resolved is None:
+            raise ValueError(f"İzin verilmeyen dosya yolu: {path}")
+        super().__init__(hass, **kwargs)
+        self.path = resolved
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for eq in batch:
+                f.write(json.dumps(eq, ensure_ascii=False) + "\n")
+
+    async def async_publish(self, batch: list[dict[str, Any]]) -> None:
+        await self.hass.async_add_executor_job(self._write, batch)
+
+
+class EventExporter:
+    """Yenilemeler arasında yeni depremleri bulup sink'lere dağıtır."""
+
+    def __init__(self, sinks: list[EventSink]) -> None:
+        self.sinks = sinks
+        # Son aktarılan/görülen anahtarlar (sınırlı, eskiden yeniye)
+        self._seen: OrderedDict[EventKey, None] = OrderedDict()
+        self._seeded = False
+
+    def start(self, entry: ConfigEntry) -> None:
+        for sink in self.sinks:
+            sink.start(entry)
+
+    async def async_stop(self) -> None:
+        for sink in self.sinks:
+            await sink.async_stop()
+
+    def process(self, earthquakes: list[dict[str, Any]]) -> None:
+        """Daha önce görülmemiş depremleri (eskiden yeniye) kuyruğa bırak.
+
+        Boş/okunamayan yanıt görülen kümeyi sıfırlamaz; sonraki tam liste
+        yeniden aktarılmaz.
+        """
+        new = [eq for eq in earthquakes if event_key(eq) not in self._seen]
+        for eq in new:
+            self._seen[event_key(eq)] = None
+        while len(self._seen) > DEFAULT_EXPORT_SEEN_SIZE:
+            self._seen.popitem(last=False)
+        # İlk dolu listede mevcut depremler sadece referans alınır, aktarılmaz
+        if not self._seeded:
+            self._seeded = bool(earthquakes)
+            return
+        if new and self.sinks:
+            new.reverse()
+            for sink in self.sinks:
+                sink.enqueue(new)
+
+
+def build_exporter(hass: HomeAssistant, mqtt_topic: str, webhook_url: str, export_file: str) -> EventExporter:
+    """Ayarlarda dolu olan sink'lerle bir exporter oluştur."""
+    sinks: list[EventSink] = []
+    if mqtt_topic:
+        sinks.append(MqttSink(hass, mqtt_topic))
+    if webhook_url:
+        sinks.append(WebhookSink(hass, webhook_url))
+    if export_file:
+        try:
+            sinks.append(FileSink(hass, export_file))
+        except ValueError as e:
+            _LOGGER.error("NDJSON sink açılmadı (allowlist_external_dirs): %s", e)
+    return EventExporter(sinks)
@@ -0,0 +1,141 @@
+"""Koordinattan il bulma (KOERI serbest metin lokasyonu il adı içermediğinde).
+
+İl sınırları `provinces.json` içinde sadeleştirilmiş çokgenler olarak gelir
+(HDX/OCHA COD-AB ilçe sınırlarından birleştirildi, ~1 km tolerans; bkz.
+scripts/build_provinces.py). Nokta önce 0.5°'lik kova indeksindeki aday
+illerin çokgenlerinde (point-in-polygon) aranır. Kara dışında kalıp
+Türkiye karasuları içindeyse ("MARMARA DENIZI", "EGE DENIZI") en yakın kıyı
+iline atanır. Sonuç ~1 km'lik grid hücresi başına önbelleklenir; aynı bölgedeki
+depremler O(1) çözülür.
+"""
+from __future__ import annotations
+
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+
+from .const import REGIONS
+
+PROVINCES_PATH = Path(__file__).parent / "provinces.json"
+
+# Grid hücre boyu (derece, ~1 km; çokgen toleransıyla aynı)
+CELL_SIZE = 0.01
+# Aday il indeksinin kova boyu (derece)
+BUCKET_SIZE = 0.5
+# Denizdeki depremin kıyı iline atanacağı en fazla uzaklık (derece)
+MAX_SEA_DISTANCE = 0.5
+
+# Kabaca Türkiye karasuları (boylam, enlem): Marmara tamamı, Karadeniz/Ege/Akdeniz
+# kıyı bandı; Yunan adaları ve komşu ülkeler dışarıda. Sadece deniz depremleri için.
+TURKEY_WATERS: tuple[tuple[float, float], ...] = (
+    (26.00, 41.75), (26.36, 41.71), (26.60, 41.97), (27.50, 42.05), (28.00, 42.10),
+    (29.50, 41.60), (31.50, 41.70), (33.00, 42.30), (35.20, 42.40), (36.50, 41.70),
+    (38.00, 41.40), (40.00, 41.40), (41.40, 41.70), (41.55, 41.52), (42.50, 41.45),
+    (43.00, 41.20), (43.50, 41.10), (43.60, 40.90), (43.70, 40.10), (44.50, 39.90),
+    (44.80, 39.72), (44.40, 39.40), (44.10, 39.00), (44.30, 38.40), (44.50, 37.90),
+    (44.80, 37.15), (44.30, 37.00), (43.00, 37.30), (42.36, 37.11), (41.00, 37.10),
+    (40.00, 36.85), (38.50, 36.85), (37.50, 36.65), (36.70, 36.80), (36.70, 36.25),
+    (36.40, 35.80), (35.60, 35.70), (34.50, 36.40), (33.50, 35.90), (32.50, 35.80),
+    (31.50, 36.20), (30.50, 36.10), (29.50, 35.90), (28.30, 36.55), (27.60, 36.65),
+    (27.20, 36.95), (27.10, 37.50), (27.10, 37.75), (26.60, 38.10), (26.22, 38.30),
+    (26.55, 38.90), (26.55, 39.45), (26.10, 39.50), (25.55, 40.00), (25.55, 40.40),
+    (25.90, 40.60), (26.05, 40.73), (26.35, 41.25), (26.60, 41.35), (26.35, 41.70),
+)
+
+# İl -> bölgeler (DÜZCE hem MARMARA hem KARADENİZ), REGIONS sırasıyla
+PROVINCE_REGIONS: dict[str, tuple[str, ...]] = {}
+for _region, _provinces in REGIONS.items():
+    for _province in _provinces:
+        PROVINCE_REGIONS[_province] = PROVINCE_REGIONS.get(_province, ()) + (_region,)
+
+Ring = list[tuple[float, float]]
+
+
+def _point_in_ring(lon: float, lat: float, ring: Ring | tuple[tuple[float, float], ...]) -> bool:
+    """Ray casting ile nokta-çokgen testi."""
+    inside = False
+    j = len(ring) - 1
+    for i, (xi, yi) in enumerate(ring):
+        xj, yj = ring[j]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _ring_distance(lon: float, lat: float, ring: Ring, lon_scale: float) -> float:
+    """Noktanın çokgen kenarına en kısa uzaklığı (derece, boylam enleme göre ölçekli)."""
+    px, py = lon * lon_scale, lat
+    best = math.inf
+    j = len(ring) - 1
+    for i, (xi, yi) in enumerate(ring):
+        xj, yj = ring[j]
+        ax, ay, bx, by = xi * lon_scale, yi, xj * lon_scale, yj
+        dx, dy = bx - ax, by - ay
+        seg = dx * dx + dy * dy
+        t = 0.0 if seg == 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / seg))
+        best = min(best, math.hypot(px - (ax + t * dx), py - (ay + t * dy)))
+        j = i
+    return best
+
+
+def _bucket(lon: float, lat: float) -> tuple[int, int]:
+    return math.floor(lon / BUCKET_SIZE), math.floor(lat / BUCKET_SIZE)
+
+
+@lru_cache(maxsize=1)
+def _load_index() -> tuple[list[tuple[str, Ring]], dict[tuple[int, int], list[int]]]:
+    """provinces.json'u ilk aramada yükle; çokgenleri ve kova -> aday indeksini kur."""
+    data = json.loads(PROVINCES_PATH.read_text(encoding="utf-8"))
+    scale = data["scale"]
+    polygons: list[tuple[str, Ring]] = []
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for province, rings in data["provinces"].items():
+        for flat in rings:
+            ring = [(flat[k] / scale, flat[k + 1] / scale) for k in range(0, len(flat), 2)]
+            index = len(polygons)
+            polygons.append((province, ring))
+            min_x, min_y = _bucket(min(x for x, _ in ring), min(y for _, y in ring))
+            max_x, max_y = _bucket(max(x for x, _ in ring), max(y for _, y in ring))
+            for bx in range(min_x, max_x + 1):
+                for by in range(min_y, max_y + 1):
+                    buckets.setdefault((bx, by), []).append(index)
+    return polygons, buckets
+
+
+@lru_cache(maxsize=8192)
+def _lookup_cell(cell_x: int, cell_y: int) -> str | None:
+    """Grid hücresinin merkezi için il; Türkiye ve karasuları dışıysa None."""
+    lon = (cell_x + 0.5) * CELL_SIZE
+    lat = (cell_y + 0.5) * CELL_SIZE
+    polygons, buckets = _load_index()
+    bx, by = _bucket(lon, lat)
+    for index in buckets.get((bx, by), ()):
+        province, ring = polygons[index]
+        if _point_in_ring(lon, lat, ring):
+            return province
+    if not _point_in_ring(lon, lat, TURKEY_WATERS):
+        return None
+    # Deniz (veya sadeleştirme boşluğu): komşu kovalardaki en yakın il
+    lon_scale = math.cos(math.radians(lat))
+    candidates = {
+        index
+        for dx in (-1, 0, 1)
+        for dy in (-1, 0, 1)
+        for index in buckets.get((bx + dx, by + dy), ())
+    }
+    best, best_distance = None, MAX_SEA_DISTANCE
+    for index in candidates:
+        province, ring = polygons[index]
+        distance = _ring_distance(lon, lat, ring, lon_scale)
+        if distance < best_distance:
+            best, best_distance = province, distance
+    return best
+
+
+def lookup_province(lat: float | None, lon: float | None) -> str | None:
+    """Koordinattan il döndür; koordinat yoksa veya Türkiye dışıysa None."""
+    if lat is None or lon is None:
+        return None
+    return _lookup_cell(math.floor(lon / CELL_SIZE), math.floor(lat / CELL_SIZE))
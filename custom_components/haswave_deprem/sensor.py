@@ -4,17 +4,20 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription, SensorStateClass
+from homeassistant.components.sensor import RestoreSensor, SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DOMAIN, LATEST_ATTRIBUTES
 
 _LOGGER = logging.getLogger(__name__)
 
+# İlk veri gelene kadar geri yüklenen attribute'lar
+RESTORED_ATTRIBUTES = LATEST_ATTRIBUTES + ("son_depremler",)
+
 SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
     "latest": SensorEntityDescription(
         key="latest",
@@ -67,7 +70,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class HasWaveDepremSensor(CoordinatorEntity, SensorEntity):
+class HasWaveDepremSensor(CoordinatorEntity, RestoreSensor):
     """Son depremler ve istatistik sensor'ı."""
 
     def __init__(
@@ -84,6 +87,23 @@ class HasWaveDepremSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{sensor_key}"
         self._attr_name = f"Deprem - {description.name}"
         self._attr_device_info = device_info
+        self._restored_value: str | float | int | None = None
+        self._restored_attrs: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """İlk KOERI verisi gelene kadar son bilinen durumu geri yükle."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            return
+        last_data = await self.async_get_last_sensor_data()
+        if last_data is not None:
+            self._restored_value = last_data.native_value
+        last_state = await self.async_get_last_state()
+        # Attribute'ları sadece "latest" sensörü taşır
+        if last_state is not None and self._sensor_key == "latest":
+            self._restored_attrs = {
+                k: v for k, v in last_state.attributes.items() if k in RESTORED_ATTRIBUTES
+            }
 
     @property
     def available(self) -> bool:
@@ -91,6 +111,8 @@ class HasWaveDepremSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | float | int | None:
+        if self.coordinator.data is None and self._restored_value is not None:
+            return self._restored_value
         earthquakes = self.coordinator.data or []
 
         if self._sensor_key == "latest":
@@ -124,21 +146,18 @@ class HasWaveDepremSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Son deprem listesi ve son deprem detayı."""
+        if self.coordinator.data is None:
+            return dict(self._restored_attrs)
         earthquakes = self.coordinator.data or []
         attrs: dict[str, Any] = {}
 
         if self._sensor_key == "latest" and earthquakes:
             latest = earthquakes[0]
-            attrs.update({
-                "magnitude": latest.get("magnitude"),
-                "location": latest.get("location"),
-                "depth": latest.get("depth"),
-                "date": latest.get("date"),
-                "timestamp": latest.get("timestamp"),
-            })
-
-        # Tüm son depremler listesi (son 20)
-        if earthquakes:
+            attrs.update({key: latest.get(key) for key in LATEST_ATTRIBUTES})
+
+        # Son depremler listesi (son 20) sadece "latest" sensöründe; diğer dört sensörde
+        # aynı liste state machine ve recorder'da entry başına kopyalanıyordu
+        if self._sensor_key == "latest" and earthquakes:
             attrs["son_depremler"] = [
                 {
                     "magnitude": e.get("magnitude"),
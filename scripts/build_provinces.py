@@ -0,0 +1,67 @@
+"""geo.py'nin kullandığı sadeleştirilmiş il sınırlarını (provinces.json) üretir.
+
+Kaynak: HDX/OCHA Türkiye COD-AB ADM2 (ilçe) sınırları; PyPI'deki `turkiye`
+paketinde `turkiye/data/maps/tur_polbna_adm2.shp` olarak gelir. İlçeler ile
+birleştirilir, sadeleştirilir ve tamsayı (derece x 1000) düz listeler olarak
+yazılır. Sadece veri yenilenirken çalıştırılır; entegrasyon çalışırken
+pyshp/shapely gerekmez.
+
+    pip install pyshp shapely
+    python scripts/build_provinces.py /yol/tur_polbna_adm2.shp
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import shapefile
+from shapely.geometry import shape
+from shapely.ops import unary_union
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "custom_components" / "haswave_deprem" / "provinces.json"
+
+sys.path.insert(0, str(ROOT / "custom_components" / "haswave_deprem"))
+from const import CITIES  # noqa: E402
+
+_FOLD = str.maketrans("İIŞĞÜÖÇ", "IISGUOC")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("shapefile", help="tur_polbna_adm2.shp yolu")
+    parser.add_argument("--tolerance", type=float, default=0.01, help="Sadeleştirme toleransı (derece)")
+    parser.add_argument("--min-area", type=float, default=1e-4, help="Daha küçük adaları at (derece^2)")
+    args = parser.parse_args()
+
+    # Kaynaktaki yazım farklarını (ESKİŞEHIR) const.CITIES adlarına eşle
+    names = {il.translate(_FOLD): il for il in CITIES}
+    groups: dict[str, list] = {}
+    for item in shapefile.Reader(args.shapefile).iterShapeRecords():
+        province = names[item.record["adm1_tr"].upper().translate(_FOLD)]
+        groups.setdefault(province, []).append(shape(item.shape.__geo_interface__))
+
+    provinces: dict[str, list[list[int]]] = {}
+    for province in CITIES:
+        merged = unary_union(groups[province]).simplify(args.tolerance, preserve_topology=True)
+        polygons = [merged] if merged.geom_type == "Polygon" else list(merged.geoms)
+        provinces[province] = [
+            [v for x, y in polygon.exterior.coords[:-1] for v in (round(x * 1000), round(y * 1000))]
+            for polygon in polygons
+            if polygon.area >= args.min_area
+        ]
+
+    data = {
+        "source": "HDX/OCHA Türkiye COD-AB ADM2, ilçelerden birleştirildi",
+        "tolerance": args.tolerance,
+        "scale": 1000,
+        "provinces": provinces,
+    }
+    OUTPUT.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    print(f"{OUTPUT}: {sum(len(r) // 2 for rings in provinces.values() for r in rings)} nokta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,529 @@
+"""KOERI lst0.asp kayıtlarını yerel bir sunucudan tekrar oynatan yük testi aracı.
+
+Kaydedilmiş (veya sentetik) lst0.asp anlık görüntülerini ayrı bir süreçteki
+stub HTTP sunucusundan belirtilen hızda sunar ve entegrasyonu bir test
+Home Assistant örneğinde gerçek config entry'lerle kurar:
+
+    async_setup_entry (arka plan ilk yenileme) -> HasWaveDepremAPI.fetch_earthquakes
+    -> coordinator async_update_data -> paylaşılan önbellek / export sink'leri
+    -> entity state yazımı
+
+Uçtan uca uyarı gecikmesini (görüntü yayını -> state_changed), yenileme başına
+CPU süresini (tracemalloc kapalı geçişte, sunucu süreci hariç) ve ayrı bir
+geçişte bellek kullanımını raporlar. `--webhook` ile aynı stub sunucu, webhook
+sink'i için HTTP karşılayıcı olarak da çalışır; `--export-file` NDJSON sink'ini
+her geçişte boş, allowlist'e eklenmiş geçici bir klasöre yazar. KOERI'ye erişim gerekmez.
+
+Gereksinim: pytest-homeassistant-custom-component (test HA örneği için).
+
+    python scripts/replay.py --entries 20 --steps 10 --step-seconds 2
+    python scripts/replay.py --snapshots kayitlar/ --speed 10 --webhook
+    python scripts/replay.py --entries 50 --same-filter --steps 3   # önbellek/bellek
+    python scripts/replay.py --record kayitlar/   # canlı KOERI'den bir kayıt al
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import multiprocessing
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.core import Event, HomeAssistant, callback  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.loader import DATA_CUSTOM_COMPONENTS  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.haswave_deprem import api as api_module  # noqa: E402
+from custom_components.haswave_deprem.api import HasWaveDepremAPI, _parse_koeri_content  # noqa: E402
+from custom_components.haswave_deprem.cache import get_event_cache  # noqa: E402
+from custom_components.haswave_deprem.const import CITIES, DOMAIN, KOERI_URL, REGIONS  # noqa: E402
+
+# Bellek geçişinde coordinator zamanlayıcısı fiilen kapalı (saniye)
+MEMORY_PASS_INTERVAL = 86400
+
+HEADER = (
+    "Tarih      Saat      Enlem(N)  Boylam(E) Derinlik(km)  MD   ML   Mw    Yer"
+    "                                             Çözüm Niteliği\n"
+    "---------- --------  --------  -------   ----------    ------------    --------------"
+    "                                  --------------\n"
+)
+
+
+def _koeri_line(ts: datetime, magnitude: float, location: str) -> str:
+    """lst0.asp biçiminde tek satır: KOERI gibi sadece ML dolu, MD ve Mw "-.-"."""
+    lat = random.uniform(36.0, 42.0)
+    lon = random.uniform(26.0, 45.0)
+    depth = random.uniform(2.0, 30.0)
+    return (
+        f"{ts:%Y.%m.%d %H:%M:%S}  {lat:7.4f}   {lon:7.4f}       {depth:5.1f}      -.-  "
+        f"{magnitude:3.1f}  -.-   {location:<50}İlksel\n"
+    )
+
+
+def synthesize_snapshots(count: int, events: int = 500) -> list[bytes]:
+    """Her adımda en üste bir yeni deprem eklenen sentetik lst0.asp görüntüleri."""
+    rnd_locations = [f"MERKEZ ({il})" for il in CITIES] + ["MARMARA DENIZI", "EGE DENIZI"]
+    now = datetime.now().replace(microsecond=0)
+    lines = [
+        _koeri_line(now - timedelta(minutes=5 * (i + 1)), round(random.uniform(1.0, 4.5), 1), random.choice(rnd_locations))
+        for i in range(events)
+    ]
+    snapshots: list[bytes] = []
+    for step in range(count):
+        if step:
+            # Her yeni adımda eşiği geçen (uyarı üreten) bir deprem
+            lines.insert(0, _koeri_line(now + timedelta(seconds=step), 5.0, random.choice(rnd_locations)))
+            lines.pop()
+        snapshots.append((HEADER + "".join(lines)).encode("iso-8859-9", errors="replace"))
+    return snapshots
+
+
+def load_snapshots(directory: Path) -> list[bytes]:
+    """Klasördeki kayıtları dosya adına göre sıralı yükle."""
+    files = sorted(p for p in directory.iterdir() if p.is_file())
+    if not files:
+        raise SystemExit(f"Kayıt bulunamadı: {directory}")
+    return [p.read_bytes() for p in files]
+
+
+def parse_snapshots(snapshots: list[bytes]) -> list[list[dict[str, Any]]]:
+    """Görüntüleri entegrasyonun parser'ıyla çöz; olay çıkmayan görüntüde dur.
+
+    Boş görüntüyle ölçülen gecikme/CPU/önbellek sayıları anlamsızdır.
+    """
+    parsed = [_parse_koeri_content(raw, limit=500) for raw in snapshots]
+    empty = [i for i, events in enumerate(parsed) if not events]
+    if empty:
+        raise SystemExit(f"Parse edilebilen olay yok, görüntüler: {empty}")
+    return parsed
+
+
+def expected_alerts(
+    args: argparse.Namespace, parsed: list[list[dict[str, Any]]]
+) -> list[dict[int, float]]:
+    """Entry başına beklenen uyarılar: {yeni son deprem timestamp'i: yayın görüntüsü}.
+
+    Eşiği geçen ve ilk görüntüdekinden yeni olan her "son deprem" bir uyarıdır;
+    görüntüler yenileme aralığından hızlı gelip atlanırsa gözlenmez (kaçan uyarı).
+    """
+    expected: list[dict[int, float]] = []
+    for city, region in _entry_filters(args.entries, args.same_filter):
+        api = HasWaveDepremAPI(
+            min_magnitude=args.min_magnitude, limit=args.limit, city=city, region=region
+        )
+        alerts: dict[int, float] = {}
+        initial = api.filter_earthquakes(parsed[0])
+        last_ts = initial[0]["timestamp"] if initial else 0
+        for index, events in enumerate(parsed[1:], start=1):
+            filtered = api.filter_earthquakes(events)
+            if not filtered:
+                continue
+            latest = filtered[0]
+            if latest["timestamp"] > last_ts:
+                last_ts = latest["timestamp"]
+                if latest["magnitude"] >= args.notify_above:
+                    alerts[latest["timestamp"]] = index
+        expected.append(alerts)
+    return expected
+
+
+def record_snapshot(directory: Path) -> Path:
+    """Canlı KOERI lst0.asp çıktısını zaman damgalı dosyaya kaydet."""
+    import requests
+
+    directory.mkdir(parents=True, exist_ok=True)
+    response = requests.get(KOERI_URL, timeout=15)
+    response.raise_for_status()
+    path = directory / f"lst0_{datetime.now():%Y%m%d_%H%M%S}.asp"
+    path.write_bytes(response.content)
+    return path
+
+
+def _serve(snapshots: list[bytes], index, counters, port) -> None:
+    """Ayrı süreçte: GET -> güncel görüntü, POST -> webhook karşılayıcı (olay sayar)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            with counters.get_lock():
+                counters[0] += 1
+            body = snapshots[index.value]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=iso-8859-9")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:  # noqa: N802
+            batch = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"[]")
+            with counters.get_lock():
+                counters[1] += 1
+                counters[2] += len(batch)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002
+            return
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port.value = httpd.server_address[1]
+    httpd.serve_forever()
+
+
+class SnapshotServer:
+    """Sırayla ilerletilen lst0.asp görüntülerini ayrı süreçte sunan stub sunucu.
+
+    Sunucu ayrı süreçte çalışır; ölçülen süreç CPU'suna dahil olmaz.
+    """
+
+    def __init__(self, snapshots: list[bytes]) -> None:
+        # spawn: çalışan HA event loop'u ve iş parçacıkları alt sürece kopyalanmaz
+        ctx = multiprocessing.get_context("spawn")
+        self._count = len(snapshots)
+        self._index = ctx.Value("i", 0)
+        # [GET istekleri, webhook POST'ları, webhook ile gelen olaylar]
+        self._counters = ctx.Array("i", 3)
+        self._port = ctx.Value("i", 0)
+        self._process = ctx.Process(
+            target=_serve, args=(snapshots, self._index, self._counters, self._port), daemon=True
+        )
+        # Görüntü indeksi -> yayın zamanı (gecikme olayın ilk göründüğü görüntüye göre)
+        self.published_at: list[float] = [time.monotonic()]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._port.value}"
+
+    @property
+    def index(self) -> int:
+        return self._index.value
+
+    @property
+    def has_next(self) -> bool:
+        return self._index.value + 1 < self._count
+
+    @property
+    def requests(self) -> int:
+        return self._counters[0]
+
+    @property
+    def webhook_posts(self) -> int:
+        return self._counters[1]
+
+    @property
+    def webhook_events(self) -> int:
+        return self._counters[2]
+
+    def advance(self) -> None:
+        """Bir sonraki görüntüyü yayınla ve yayın zamanını kaydet."""
+        self._index.value += 1
+        self.published_at.append(time.monotonic())
+
+    async def async_start(self) -> None:
+        self._process.start()
+        while not self._port.value:
+            await asyncio.sleep(0.01)
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+
+
+def _entry_filters(count: int, same: bool = False) -> list[tuple[str, str]]:
+    """Entry başına (il, bölge) filtresi: tümü, il ve bölge karışık.
+
+    same: hepsi filtresiz; entry'ler aynı olayları görür (önbellek paylaşımı ölçümü).
+    """
+    if same:
+        return [("", "")] * count
+    regions = list(REGIONS)
+    filters: list[tuple[str, str]] = []
+    for i in range(count):
+        if i % 3 == 0:
+            filters.append(("", ""))
+        elif i % 3 == 1:
+            filters.append((CITIES[i % len(CITIES)], ""))
+        else:
+            filters.append(("", regions[i % len(regions)]))
+    return filters
+
+
+def _state_attributes_size(hass: HomeAssistant, entries: list[MockConfigEntry]) -> int:
+    """Entry'lerin tüm entity'lerinin state attribute'larının JSON boyutu (bayt)."""
+    registry = er.async_get(hass)
+    size = 0
+    for entry in entries:
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+            state = hass.states.get(entity.entity_id)
+            if state is not None:
+                size += len(json.dumps(dict(state.attributes), default=str))
+    return size
+
+
+def _count_ndjson_lines(directory: Path) -> int:
+    """NDJSON sink'lerinin yazdığı satırlar; her satırın geçerli JSON olduğu doğrulanır."""
+    count = 0
+    for path in directory.glob("*.ndjson"):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            json.loads(line)
+            count += 1
+    return count
+
+
+async def _async_wait(predicate, timeout: float) -> bool:
+    end = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > end:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+async def async_run(
+    args: argparse.Namespace,
+    snapshots: list[bytes],
+    expected: list[dict[int, float]],
+    trace_memory: bool,
+) -> dict[str, Any]:
+    """Tek bir tekrar oynatma geçişi; trace_memory açıksa sadece bellek ölçülür."""
+    server = SnapshotServer(snapshots)
+    await server.async_start()
+    if trace_memory:
+        tracemalloc.start()
+
+    export_dir = tempfile.TemporaryDirectory(prefix="haswave_replay_")
+    try:
+        async with async_test_home_assistant() as hass:
+            # Test örneği custom integration'ları kapatır; repo kökü sys.path'te
+            hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+
+            # Her geçişte boş NDJSON klasörü; kullanıcının configuration.yaml'da
+            # yapacağı gibi allowlist_external_dirs'e eklenir
+            hass.config.allowlist_external_dirs.add(export_dir.name)
+
+            entries: list[MockConfigEntry] = []
+            for i, (city, region) in enumerate(_entry_filters(args.entries, args.same_filter)):
+                options: dict[str, Any] = {
+                    # Bellek geçişinde zamanlayıcı kapalı; yenilemeler aşağıda elle yapılır
+                    "update_interval": MEMORY_PASS_INTERVAL if trace_memory else args.update_interval,
+                    "notify_above_magnitude": args.notify_above,
+                }
+                if args.webhook:
+                    options["webhook_url"] = f"{server.base_url}/webhook/{i}"
+                if args.export_file:
+                    options["export_file"] = str(Path(export_dir.name) / f"{i}.ndjson")
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    title=f"replay_{i}",
+                    data={
+                        "url": f"{server.base_url}/scripts/lst0.asp",
+                        "limit": args.limit,
+                        "min_magnitude": args.min_magnitude,
+                        "all_earthquakes": not (city or region),
+                        "city": city,
+                        "region": region,
+                    },
+                    options=options,
+                )
+                entry.add_to_hass(hass)
+                entries.append(entry)
+
+            # Domain kurulumu eklenmiş tüm entry'leri kurar (HA açılışındaki gibi)
+            setup_start = time.monotonic()
+            assert await async_setup_component(hass, DOMAIN, {})
+            setup_s = time.monotonic() - setup_start
+
+            registry = er.async_get(hass)
+            # Son deprem sensörü -> entry sırası
+            latest_entities = {
+                registry.async_get_entity_id("sensor", DOMAIN, f"{DOMAIN}_{entry.entry_id}_latest"): i
+                for i, entry in enumerate(entries)
+            }
+            coordinators = [hass.data[DOMAIN][entry.entry_id]["coordinator"] for entry in entries]
+
+            # Arka plandaki ilk yenilemeler bitene kadar bekle (açılışta KOERI gecikmesi)
+            await _async_wait(lambda: all(c.data is not None for c in coordinators), 60)
+            first_refresh_s = time.monotonic() - setup_start
+
+            latencies: list[float] = []
+            observed: set[tuple[int, int]] = set()
+            refreshes = 0
+            state_changes = 0
+
+            @callback
+            def _on_refresh() -> None:
+                nonlocal refreshes
+                refreshes += 1
+
+            @callback
+            def _on_state_changed(event: Event) -> None:
+                nonlocal state_changes
+                entity_id = event.data["entity_id"]
+                if entity_id not in latest_entities or event.data.get("new_state") is None:
+                    return
+                state_changes += 1
+                entry_index = latest_entities[entity_id]
+                ts = event.data["new_state"].attributes.get("timestamp") or 0
+                snapshot = expected[entry_index].get(ts)
+                if snapshot is None or (entry_index, ts) in observed:
+                    return
+                observed.add((entry_index, ts))
+                latencies.append(time.monotonic() - server.published_at[snapshot])
+
+            unsubs = [c.async_add_listener(_on_refresh) for c in coordinators]
+            unsubs.append(hass.bus.async_listen(EVENT_STATE_CHANGED, _on_state_changed))
+
+            cpu_start = time.process_time()
+            wall_start = time.monotonic()
+            while server.has_next:
+                if trace_memory:
+                    # tracemalloc parse'ı ~5x yavaşlatır; zamanlayıcıyla çok entry'de
+                    # yenilemeler birikir. Her görüntüde tüm entry'ler bir kez yenilenir.
+                    server.advance()
+                    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+                    continue
+                await asyncio.sleep(args.step_seconds / args.speed)
+                server.advance()
+            if not trace_memory:
+                await asyncio.sleep(args.update_interval + 1)
+            wall = time.monotonic() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            for unsub in unsubs:
+                unsub()
+            cache_size = get_event_cache(hass).stats()["size"]
+            # Entry'ler yüklüyken: süreç belleği, deprem nesneleri (api.py'de oluşturulan
+            # dict'ler; önbellek sayesinde entry sayısından bağımsız olmalı) ve state
+            # machine'e (recorder'a) giden attribute boyutu
+            if trace_memory:
+                await hass.async_block_till_done()
+                gc.collect()
+                snapshot = tracemalloc.take_snapshot()
+                loaded_kb = round(sum(s.size for s in snapshot.statistics("filename")) / 1024, 1)
+                events_kb = round(
+                    sum(s.size for s in snapshot.filter_traces(
+                        [tracemalloc.Filter(True, api_module.__file__)]
+                    ).statistics("filename")) / 1024,
+                    1,
+                )
+            attributes_kb = round(_state_attributes_size(hass, entries) / 1024, 1)
+            exporters = [hass.data[DOMAIN][entry.entry_id]["exporter"] for entry in entries]
+
+            # Unload: sink kuyrukları boşaltılır, önbellek görünümleri bırakılır
+            for entry in entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            cache_after_unload = get_event_cache(hass).stats()["size"]
+            export_lines = await hass.async_add_executor_job(
+                _count_ndjson_lines, Path(export_dir.name)
+            )
+            export_failed = sum(s.failed for ex in exporters for s in ex.sinks)
+            export_dropped = sum(s.dropped for ex in exporters for s in ex.sinks)
+
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                return {
+                    "mem_loaded_kb": loaded_kb,
+                    "mem_loaded_kb_per_entry": round(loaded_kb / len(entries), 1),
+                    "mem_events_kb": events_kb,
+                    "mem_current_kb": round(current / 1024, 1),
+                    "mem_peak_kb": round(peak / 1024, 1),
+                    "event_cache_size": cache_size,
+                    "event_cache_after_unload": cache_after_unload,
+                }
+            return {
+                "entries": len(entries),
+                "snapshots": len(snapshots),
+                "setup_s": round(setup_s, 3),
+                "first_refresh_s": round(first_refresh_s, 3),
+                "http_requests": server.requests,
+                "refreshes": refreshes,
+                "state_changes": state_changes,
+                "wall_s": round(wall, 2),
+                "cpu_s": round(cpu, 3),
+                "cpu_ms_per_refresh": round(1000 * cpu / refreshes, 3) if refreshes else 0.0,
+                "alerts_expected": sum(len(alerts) for alerts in expected),
+                "alerts": len(latencies),
+                "alerts_missed": sum(len(alerts) for alerts in expected) - len(observed),
+                "latency_p50_s": round(statistics.median(latencies), 3) if latencies else 0.0,
+                "latency_max_s": round(max(latencies), 3) if latencies else 0.0,
+                "webhook_posts": server.webhook_posts,
+                "webhook_events": server.webhook_events,
+                "state_attributes_kb": attributes_kb,
+                "ndjson_events": export_lines,
+                "export_failed": export_failed,
+                "export_dropped": export_dropped,
+            }
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        server.stop()
+        export_dir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snapshots", help="Kayıtlı lst0.asp dosyalarının klasörü (yoksa sentetik)")
+    parser.add_argument("--record", help="Canlı KOERI çıktısını bu klasöre kaydet ve çık")
+    parser.add_argument("--entries", type=int, default=10, help="Config entry sayısı")
+    parser.add_argument("--steps", type=int, default=10, help="Sentetik görüntü adımı")
+    parser.add_argument("--step-seconds", type=float, default=2.0, help="Görüntüler arası süre")
+    parser.add_argument("--speed", type=float, default=1.0, help="Oynatma hızı çarpanı")
+    parser.add_argument("--update-interval", type=int, default=1, help="Coordinator aralığı (sn)")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--min-magnitude", type=float, default=0.0)
+    parser.add_argument("--notify-above", type=float, default=4.0)
+    parser.add_argument("--webhook", action="store_true", help="Webhook sink'ini stub sunucuya bağla")
+    parser.add_argument("--export-file", action="store_true", help="NDJSON dosya sink'ini aç (geçici klasör)")
+    parser.add_argument("--same-filter", action="store_true", help="Tüm entry'ler filtresiz (aynı olaylar)")
+    parser.add_argument("--skip-memory", action="store_true", help="Bellek geçişini atla")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.record:
+        print(record_snapshot(Path(args.record)))
+        return
+
+    if args.snapshots:
+        snapshots = load_snapshots(Path(args.snapshots))
+    else:
+        snapshots = synthesize_snapshots(args.steps + 1)
+
+    parsed = parse_snapshots(snapshots)
+    counts = [len(events) for events in parsed]
+    expected = expected_alerts(args, parsed)
+
+    results: dict[str, Any] = {
+        "events_per_snapshot_min": min(counts),
+        "events_per_snapshot_max": max(counts),
+    }
+    # CPU/gecikme ve bellek ayrı geçişlerde: tracemalloc CPU ölçümünü şişirir
+    results.update(asyncio.run(async_run(args, snapshots, expected, trace_memory=False)))
+    if not args.skip_memory:
+        results.update(asyncio.run(async_run(args, snapshots, expected, trace_memory=True)))
+    for key, value in results.items():
+        print(f"{key:>26}: {value}")
+
+
+if __name__ == "__main__":
+    main()
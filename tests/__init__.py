@@ -0,0 +1 @@
+"""Tests for the HasWave Deprem integration."""
@@ -0,0 +1,8 @@
+"""HasWave Deprem test fixtures."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """custom_components/haswave_deprem'i testlerde yüklenebilir yap."""
+    yield
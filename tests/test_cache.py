@@ -0,0 +1,120 @@
+"""Paylaşılan olay önbelleği ve exporter tekrar-aktarım testleri."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.haswave_deprem import cache as cache_module
+from custom_components.haswave_deprem.cache import EventCache, event_key
+from custom_components.haswave_deprem.export import EventExporter
+
+
+def _eq(minute: int, magnitude: float = 2.0, location: str = "SINDIRGI (BALIKESIR)") -> dict:
+    return {
+        "date": f"2026.10.19 10:{minute:02d}:00",
+        "timestamp": 1792400000 + minute * 60,
+        "magnitude": magnitude,
+        "location": location,
+    }
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """cache.time.monotonic yerine elle ilerletilen saat."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_share_interned_events(clock: list[float]) -> None:
+    cache = EventCache()
+    view_a = cache.set_view("a", [_eq(1), _eq(2)])
+    view_b = cache.set_view("b", [_eq(2)])
+    assert view_b[0] is view_a[1]
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["views"] == {"a": 2, "b": 1}
+
+
+def test_revision_replaces_without_mutating(clock: list[float]) -> None:
+    cache = EventCache()
+    original = cache.set_view("a", [_eq(1, magnitude=2.0)])[0]
+    revised = cache.set_view("b", [_eq(1, magnitude=2.4)])[0]
+    assert revised is not original
+    assert original["magnitude"] == 2.0
+    # Entry "a" eski nesneyi tutmaya devam eder; yeni okuyucular revizyonu alır
+    assert cache.set_view("c", [_eq(1, magnitude=2.4)])[0] is revised
+    assert cache.stats()["size"] == 1
+
+
+def test_release_drops_references(clock: list[float]) -> None:
+    cache = EventCache(max_size=10, max_age=60)
+    cache.set_view("a", [_eq(1), _eq(2)])
+    cache.set_view("b", [_eq(2)])
+    cache.release("a")
+    stats = cache.stats()
+    assert stats["views"] == {"b": 1}
+    assert stats["referenced"] == 1
+    assert stats["unreferenced"] == 1
+    # Yaş sınırı geçince referanssız olay atılır, referanslı kalır
+    clock[0] += 61
+    cache.release("missing")
+    assert cache.stats()["size"] == 1
+    assert cache.stats()["evicted"] == 1
+
+
+def test_over_size_keeps_referenced_events(clock: list[float]) -> None:
+    cache = EventCache(max_size=2, max_age=3600)
+    cache.set_view("a", [_eq(1), _eq(2), _eq(3)])
+    # Hepsi görünümde: boyut sınırı aşılsa da atılmaz
+    assert cache.stats()["size"] == 3
+    cache.set_view("a", [_eq(3)])
+    # İki olay referanssız kaldı; sınıra inene kadar en eski erişilen atılır
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evicted"] == 1
+
+
+def test_view_replacement_moves_references(clock: list[float]) -> None:
+    cache = EventCache(max_size=10, max_age=60)
+    cache.set_view("a", [_eq(1)])
+    cache.set_view("a", [_eq(2)])
+    stats = cache.stats()
+    assert stats["referenced"] == 1
+    assert stats["unreferenced"] == 1
+    clock[0] += 61
+    cache.set_view("a", [_eq(2)])
+    assert cache.stats()["size"] == 1
+
+
+def test_event_key_ignores_other_fields() -> None:
+    assert event_key(_eq(1, magnitude=2.0)) == event_key(_eq(1, magnitude=3.1))
+    assert event_key(_eq(1)) != event_key(_eq(1, location="MARMARA DENIZI"))
+
+
+class _RecordingSink:
+    def __init__(self) -> None:
+        self.batches: list[list[dict]] = []
+
+    def enqueue(self, events: list[dict]) -> None:
+        self.batches.append(list(events))
+
+
+def test_exporter_seeds_on_first_list() -> None:
+    sink = _RecordingSink()
+    exporter = EventExporter([sink])
+    # Boş ilk yanıt referans sayılmaz
+    exporter.process([])
+    exporter.process([_eq(2), _eq(1)])
+    assert sink.batches == []
+    exporter.process([_eq(3), _eq(2), _eq(1)])
+    assert sink.batches == [[_eq(3)]]
+
+
+def test_exporter_dedups_across_blank_responses() -> None:
+    sink = _RecordingSink()
+    exporter = EventExporter([sink])
+    exporter.process([_eq(1)])
+    exporter.process([])
+    exporter.process([_eq(3), _eq(2), _eq(1)])
+    # Eskiden yeniye ve sadece yeniler
+    assert sink.batches == [[_eq(2), _eq(3)]]
+    exporter.process([_eq(3), _eq(2), _eq(1)])
+    assert len(sink.batches) == 1
@@ -0,0 +1,144 @@
+"""MQTT / webhook / NDJSON sink testleri (yerel MQTT mock'u ve HTTP karşılayıcı ile)."""
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.haswave_deprem import export
+from custom_components.haswave_deprem.const import DOMAIN
+from custom_components.haswave_deprem.export import (
+    FileSink,
+    MqttSink,
+    WebhookSink,
+    build_exporter,
+)
+
+WEBHOOK_URL = "http://127.0.0.1:8123/deprem"
+
+
+def _eq(minute: int) -> dict:
+    return {
+        "date": f"2026.10.19 10:{minute:02d}:00",
+        "timestamp": 1792400000 + minute * 60,
+        "magnitude": 2.5,
+        "location": "SINDIRGI (BALIKESIR)",
+        "province": "BALIKESİR",
+    }
+
+
+@pytest.fixture
+def entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def export_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Geçici config klasörü; sadece export/ allowlist_external_dirs içinde."""
+    hass.config.config_dir = str(tmp_path)
+    hass.config.allowlist_external_dirs = {str(tmp_path / "export")}
+    return tmp_path / "export"
+
+
+async def test_mqtt_sink_publishes_each_event(hass: HomeAssistant, mqtt_mock, entry) -> None:
+    sink = MqttSink(hass, "deprem/yeni")
+    sink.start(entry)
+    sink.enqueue([_eq(1), _eq(2)])
+    await sink.async_stop()
+
+    calls = mqtt_mock.async_publish.call_args_list
+    assert [call.args[0] for call in calls] == ["deprem/yeni", "deprem/yeni"]
+    assert [json.loads(call.args[1]) for call in calls] == [_eq(1), _eq(2)]
+    assert sink.failed == 0
+
+
+async def test_webhook_sink_posts_batches(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, entry
+) -> None:
+    aioclient_mock.post(WEBHOOK_URL, status=200)
+    sink = WebhookSink(hass, WEBHOOK_URL, batch_size=2)
+    sink.enqueue([_eq(1), _eq(2), _eq(3)])
+    sink.start(entry)
+    await sink.async_stop()
+
+    assert [call[2] for call in aioclient_mock.mock_calls] == [[_eq(1), _eq(2)], [_eq(3)]]
+
+
+async def test_webhook_failure_is_counted(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, entry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(export, "DEFAULT_EXPORT_RETRIES", 1)
+    aioclient_mock.post(WEBHOOK_URL, status=500)
+    sink = WebhookSink(hass, WEBHOOK_URL)
+    sink.start(entry)
+    sink.enqueue([_eq(1), _eq(2)])
+    await sink.async_stop()
+    assert sink.failed == 2
+
+
+async def test_file_sink_writes_ndjson(hass: HomeAssistant, export_dir: Path, entry) -> None:
+    sink = FileSink(hass, "export/deprem.ndjson")
+    sink.start(entry)
+    sink.enqueue([_eq(1)])
+    sink.enqueue([_eq(2)])
+    await sink.async_stop()
+
+    lines = (export_dir / "deprem.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [_eq(1), _eq(2)]
+
+
+@pytest.mark.parametrize("path", ["deprem.ndjson", "export/../deprem.ndjson", "/tmp/deprem.ndjson"])
+async def test_file_sink_rejects_paths_outside_allowlist(
+    hass: HomeAssistant, export_dir: Path, path: str
+) -> None:
+    with pytest.raises(ValueError):
+        FileSink(hass, path)
+    exporter = build_exporter(hass, mqtt_topic="", webhook_url="", export_file=path)
+    assert exporter.sinks == []
+
+
+async def test_enqueue_drops_oldest_and_logs_once(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    sink = WebhookSink(hass, WEBHOOK_URL, queue_size=2)
+    with caplog.at_level(logging.WARNING):
+        sink.enqueue([_eq(i) for i in range(5)])
+    assert sink.dropped == 3
+    assert len([r for r in caplog.records if "düşürüldü" in r.getMessage()]) == 1
+    # Kuyrukta en yeni iki olay kalır
+    assert [sink._queue.get_nowait() for _ in range(2)] == [_eq(3), _eq(4)]
+
+
+async def test_options_flow_validates_export_targets(
+    hass: HomeAssistant, export_dir: Path, entry
+) -> None:
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    user_input = {
+        "update_interval": 300,
+        "notify_above_magnitude": 4.0,
+        "mqtt_topic": "",
+        "webhook_url": "",
+        "export_file": "../deprem.ndjson",
+    }
+    result = await hass.config_entries.options.async_configure(result["flow_id"], user_input)
+    assert result["type"] == FlowResultType.FORM
+    assert "export_file" in result["errors"]
+
+    with pytest.raises(Exception):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {**user_input, "export_file": "", "webhook_url": "not a url"}
+        )
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**user_input, "export_file": "export/deprem.ndjson", "webhook_url": WEBHOOK_URL}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
@@ -0,0 +1,108 @@
+"""İl bulma (koordinat / "(IL)" eki) ve il-bölge filtresi testleri."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.haswave_deprem.api import (
+    _matches_city,
+    _matches_region,
+    _province_from_text,
+    _resolve_province,
+)
+from custom_components.haswave_deprem.geo import PROVINCE_REGIONS, lookup_province
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon", "province"),
+    [
+        (41.01, 28.97, "İSTANBUL"),
+        (39.93, 32.85, "ANKARA"),
+        (37.45, 35.81, "ADANA"),  # Kozan
+        (37.51, 34.05, "KONYA"),  # Ereğli (Konya)
+        (41.28, 31.42, "ZONGULDAK"),  # Ereğli (Zonguldak)
+        (39.24, 28.18, "BALIKESİR"),  # Sındırgı
+        (40.84, 31.16, "DÜZCE"),
+    ],
+)
+def test_lookup_land(lat: float, lon: float, province: str) -> None:
+    assert lookup_province(lat, lon) == province
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon", "region"),
+    [
+        (40.75, 28.00, "MARMARA"),  # Marmara Denizi
+        (40.70, 28.90, "MARMARA"),
+        (38.45, 26.55, "EGE"),  # İzmir açıkları
+        (36.95, 27.90, "EGE"),  # Gökova Körfezi
+    ],
+)
+def test_lookup_sea_assigns_coastal_province(lat: float, lon: float, region: str) -> None:
+    province = lookup_province(lat, lon)
+    assert province is not None
+    assert region in PROVINCE_REGIONS[province]
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon"),
+    [
+        (39.20, 26.30),  # Midilli
+        (37.75, 26.85),  # Sisam
+        (36.85, 27.20),  # İstanköy
+        (36.20, 28.00),  # Rodos
+        (37.98, 23.73),  # Atina
+        (35.17, 33.36),  # Lefkoşa
+        (36.20, 37.15),  # Halep
+        (41.70, 44.80),  # Tiflis
+    ],
+)
+def test_lookup_outside_turkey(lat: float, lon: float) -> None:
+    assert lookup_province(lat, lon) is None
+
+
+def test_lookup_without_coordinates() -> None:
+    assert lookup_province(None, 28.0) is None
+
+
+@pytest.mark.parametrize(
+    ("location", "province"),
+    [
+        ("KOZAN (ADANA)", "ADANA"),
+        ("SINDIRGI (BALIKESIR)", "BALIKESİR"),
+        ("ERDEK ACIKLARI-MARMARA DENIZI (BALIKESIR)", "BALIKESİR"),
+        ("KARAKOCAN (ELAZIG)", "ELAZIĞ"),
+        ("MARMARA DENIZI", None),
+        ("EGE DENIZI", None),
+    ],
+)
+def test_province_from_text(location: str, province: str | None) -> None:
+    assert _province_from_text(location) == province
+
+
+def test_suffix_wins_over_coordinates() -> None:
+    # Sınıra yakın nokta komşu ile düşse bile KOERI'nin eki esas alınır
+    assert _resolve_province("KOZAN (ADANA)", 39.93, 32.85) == "ADANA"
+    assert _resolve_province("MARMARA DENIZI", 40.70, 28.90) == lookup_province(40.70, 28.90)
+
+
+def test_matches_city() -> None:
+    # Tam il adı birebir: MUŞ, GÜMÜŞHANE'yi kapsamaz
+    assert _matches_city("", "MUŞ", "MUŞ")
+    assert not _matches_city("", "MUŞ", "GÜMÜŞHANE")
+    # Kısaltma ve ASCII yazım
+    assert _matches_city("", "AFYON", "AFYONKARAHİSAR")
+    assert _matches_city("", "IZMIR", "İZMİR")
+    # İl bulunamadıysa metin eşleştirmesi
+    assert _matches_city("X (ANKARA)", "ANKARA", None)
+    assert not _matches_city("X (IZMIR)", "ANKARA", None)
+
+
+def test_matches_region() -> None:
+    # DÜZCE iki bölgede
+    assert _matches_region("", "MARMARA", "DÜZCE")
+    assert _matches_region("", "KARADENİZ", "DÜZCE")
+    assert not _matches_region("", "EGE", "DÜZCE")
+    assert _matches_region("", "İÇ ANADOLU", "ÇANKIRI")
+    # İl bulunamadıysa metin eşleştirmesi
+    assert _matches_region("X (ANKARA)", "İÇ ANADOLU", None)
+    assert _matches_region("MARMARA DENIZI", "MARMARA", None)